@@ -11,6 +11,15 @@ from urllib.parse import quote
 from aiohttp import ClientSession
 from aiohttp import __version__ as http_version
 
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _json_serialize(obj) -> str:
+        return _orjson_dumps(obj).decode("utf-8")
+
+except ImportError:
+    _json_serialize = dumps
+
 from ...api.error import LibraryException
 from ...base import __version__, get_logger
 from .limiter import Limiter
@@ -67,7 +76,7 @@ class _Request:
             f"Python/{version_info[0]}.{version_info[1]} "
             f"aiohttp/{http_version}",
         }
-        self._session = ClientSession()
+        self._session = ClientSession(json_serialize=_json_serialize)
         self._global_lock = (
             Limiter(lock=Lock(loop=self._loop)) if version_info < (3, 10) else Limiter(lock=Lock())
         )
@@ -75,7 +84,7 @@ class _Request:
     def _check_session(self) -> None:
         """Ensures that we have a valid connection session."""
         if self._session.closed:
-            self._session = ClientSession()
+            self._session = ClientSession(json_serialize=_json_serialize)
 
     async def _check_lock(self) -> None:
         """Checks the global lock for its current state."""
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 __all__ = ("Emoji",)
 
+_COLON_TABLE = str.maketrans("", "", ":")
+"""Strips colons from emoji names in one C-level pass."""
+
 
 @define()
 class Emoji(ClientSerializerMixin):
@@ -56,6 +59,22 @@ class Emoji(ClientSerializerMixin):
             else self.name
         )
 
+    @property
+    def reaction_format(self) -> str:
+        """
+        .. versionadded:: 4.4.0
+
+        Formats the emoji into the ``name:id`` form the reaction endpoints
+        expect. Computed once, then reused.
+
+        :rtype: str
+        """
+        formatted = self._extras.get("reaction_format")
+        if formatted is None:
+            formatted = f":{self.name.translate(_COLON_TABLE)}:{self.id}" if self.id else self.name
+            self._extras["reaction_format"] = formatted
+        return formatted
+
     @property
     def created_at(self) -> datetime:
         """
@@ -1,10 +1,15 @@
-import contextlib
+import re
+from asyncio import create_task
 from datetime import datetime
 from enum import IntEnum
+from functools import lru_cache
 from io import BytesIO
-from typing import TYPE_CHECKING, List, Optional, Union
+from itertools import chain
+from operator import attrgetter
+from sys import intern
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Union
 
-from ...client.models.component import ActionRow, Button, SelectMenu
+from ...client.models.component import ActionRow, Button, SelectMenu, _build_components
 from ...utils.attrs_utils import (
     ClientSerializerMixin,
     DictSerializerMixin,
@@ -48,6 +53,69 @@ __all__ = (
 )
 
 
+_NOT_DELETABLE = frozenset({1, 2, 3, 4, 5, 14, 15, 16, 17, 21})
+"""Message type values that can never be deleted, hoisted for O(1) lookups."""
+
+_URL_RE = re.compile(r"channels/(?:\d+|@me)/(\d+)/(\d+)")
+"""Extracts the channel and message ids out of a message link in one pass."""
+
+_get_json = attrgetter("_json")
+"""Serializes models in C-level map() loops without a Python frame per item."""
+
+
+_Guild = None
+
+
+def _get_guild_class():
+    """Resolves the Guild model once; it must be imported lazily to dodge a circular import."""
+    global _Guild
+    if _Guild is None:
+        from .guild import Guild
+
+        _Guild = Guild
+    return _Guild
+
+
+def _norm_embeds(embeds, default=None, *, _MISSING=MISSING) -> list:
+    """Normalizes an optional embed argument into the list of jsons the API expects."""
+    if embeds is _MISSING:
+        embeds = default
+    if not embeds:
+        return []
+    if not isinstance(embeds, list):
+        return [embeds._json]
+    return list(map(_get_json, embeds))
+
+
+def _normalize_files(files, *, _MISSING=MISSING) -> tuple:
+    """
+    Normalizes an optional file argument into the payload jsons and the
+    file list handed to the HTTP client for uploading.
+    """
+    if files is _MISSING or not files:
+        # the HTTP layer checks len(files) behind an `is not MISSING` guard,
+        # so the sentinel is the only safe "nothing to upload" value
+        return [], _MISSING
+    if not isinstance(files, list):
+        files = [files]
+    return [file._json_payload(id) for id, file in enumerate(files)], files
+
+
+def _norm_allowed_mentions(allowed_mentions, *, _MISSING=MISSING) -> dict:
+    """Normalizes an optional allowed-mentions argument into its json form."""
+    if allowed_mentions is _MISSING:
+        return {}
+    if isinstance(allowed_mentions, AllowedMentions):
+        return allowed_mentions._json
+    return allowed_mentions
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parses an ISO-8601 timestamp, caching the result; gateway bursts repeat identical strings."""
+    return datetime.fromisoformat(timestamp)
+
+
 class MessageType(IntEnum):
     """
     An enumerable object representing the types of messages.
@@ -89,7 +157,19 @@ class MessageType(IntEnum):
 
         returns A list of message types which are not deletable
         """
-        return [1, 2, 3, 4, 5, 14, 15, 16, 17, 21]
+        return sorted(_NOT_DELETABLE)
+
+
+_MESSAGE_TYPE_MAP = MessageType._value2member_map_
+
+
+def _to_message_type(value) -> MessageType:
+    """
+    Resolves a raw message type without going through ``EnumMeta.__call__``;
+    values Discord added after this release fall back to ``DEFAULT`` instead
+    of raising.
+    """
+    return _MESSAGE_TYPE_MAP.get(value, MessageType.DEFAULT)
 
 
 @define()
@@ -158,7 +238,8 @@ class Attachment(ClientSerializerMixin, IDMixin):
 
     id: Snowflake = field(converter=Snowflake)
     filename: str = field()
-    content_type: Optional[str] = field(default=None)
+    # interned: only a handful of distinct MIME strings ever occur
+    content_type: Optional[str] = field(converter=intern, default=None)
     size: int = field()
     url: str = field()
     proxy_url: str = field()
@@ -177,10 +258,16 @@ class Attachment(ClientSerializerMixin, IDMixin):
         if not self._client:
             raise LibraryException(code=13)
 
+        buffer = BytesIO()
+
         async with self._client._req._session.get(self.url) as response:
-            _bytes: bytes = await response.content.read()
+            # streaming in chunks avoids holding a second full copy of the
+            # file and yields to the event loop between reads
+            async for chunk in response.content.iter_chunked(1 << 16):
+                buffer.write(chunk)
 
-        return BytesIO(_bytes)
+        buffer.seek(0)
+        return buffer
 
 
 @define()
@@ -369,7 +456,8 @@ class Embed(DictSerializerMixin):
     """
 
     title: Optional[str] = field(default=None)
-    type: Optional[str] = field(default=None)
+    # interned: limited to "rich", "image", "video", etc.
+    type: Optional[str] = field(converter=intern, default=None)
     description: Optional[str] = field(default=None)
     url: Optional[str] = field(default=None)
     timestamp: Optional[datetime] = field(
@@ -491,8 +579,7 @@ class Embed(DictSerializerMixin):
         Removes the embed's author
         """
 
-        with contextlib.suppress(AttributeError):
-            del self.author
+        self.author = None
         return self
 
     def set_author(
@@ -687,6 +774,8 @@ class StickerPack(DictSerializerMixin, IDMixin):
     description: str = field()
     banned_asset_id: Optional[Snowflake] = field(converter=Snowflake, default=None)
 
+    _sticker_index: Optional[Dict[int, Sticker]] = field(init=False, default=None, repr=False)
+
     @property
     def created_at(self) -> datetime:
         """
@@ -696,6 +785,21 @@ class StickerPack(DictSerializerMixin, IDMixin):
         """
         return self.id.timestamp
 
+    def get_sticker(self, sticker_id: Union[int, Snowflake]) -> Optional[Sticker]:
+        """
+        .. versionadded:: 4.4.0
+
+        Gets a sticker of the pack by its ID, without scanning the full list.
+
+        :param Union[int, Snowflake] sticker_id: The ID of the sticker to get
+        :return: The sticker, if present in the pack
+        :rtype: Optional[Sticker]
+        """
+        index = self._sticker_index
+        if index is None:
+            self._sticker_index = index = {int(sticker.id): sticker for sticker in self.stickers}
+        return index.get(int(sticker_id))
+
 
 @define()
 class ReactionObject(DictSerializerMixin):
@@ -755,8 +859,8 @@ class Message(ClientSerializerMixin, IDMixin):
     author: User = field(converter=User, add_client=True, default=None)
     member: Optional[Member] = field(converter=Member, default=None, add_client=True)
     content: str = field(default=None)
-    timestamp: datetime = field(converter=datetime.fromisoformat, default=None)
-    edited_timestamp: Optional[datetime] = field(converter=datetime.fromisoformat, default=None)
+    timestamp: datetime = field(converter=_parse_iso, default=None)
+    edited_timestamp: Optional[datetime] = field(converter=_parse_iso, default=None)
     tts: bool = field(default=None)
     mention_everyone: bool = field(default=None)
     # mentions: array of Users, and maybe partial members
@@ -777,7 +881,7 @@ class Message(ClientSerializerMixin, IDMixin):
     nonce: Optional[Union[int, str]] = field(default=None, repr=False)
     pinned: bool = field(default=None)
     webhook_id: Optional[Snowflake] = field(converter=Snowflake, default=None)
-    type: MessageType = field(converter=MessageType, default=None)
+    type: MessageType = field(converter=_to_message_type, default=None)
     activity: Optional[MessageActivity] = field(converter=MessageActivity, default=None)
     application: Optional[Application] = field(converter=Application, default=None)
     application_id: Optional[Snowflake] = field(converter=Snowflake, default=None)
@@ -799,11 +903,17 @@ class Message(ClientSerializerMixin, IDMixin):
     position: Optional[int] = field(default=None, repr=False)
 
     def __attrs_post_init__(self):
-        if self.member and self.guild_id:
-            self.member._extras["guild_id"] = self.guild_id
+        if isinstance(self.referenced_message, dict):
+            self.referenced_message = Message(**self.referenced_message, _client=self._client)
 
-        if self.author and self.member:
-            self.member.user = self.author
+        member = self.member
+        if member is None:
+            return
+
+        if guild_id := self.guild_id:
+            member._extras["guild_id"] = guild_id
+        if author := self.author:
+            member.user = author
 
     @property
     def deletable(self) -> bool:
@@ -812,7 +922,7 @@ class Message(ClientSerializerMixin, IDMixin):
 
         Returns if the message can be deleted or not
         """
-        return self.type not in self.type.not_deletable()
+        return self.type not in _NOT_DELETABLE
 
     @property
     def created_at(self) -> datetime:
@@ -823,9 +933,6 @@ class Message(ClientSerializerMixin, IDMixin):
         """
         return self.id.timestamp
 
-        if self.referenced_message is not None:
-            self.referenced_message = Message(**self.referenced_message, _client=self._client)
-
     async def get_channel(self) -> Channel:
         """
         .. versionadded:: 4.0.2
@@ -849,10 +956,8 @@ class Message(ClientSerializerMixin, IDMixin):
         """
         if not self._client:
             raise LibraryException(code=13)
-        from .guild import Guild
-
         res = await self._client.get_guild(guild_id=int(self.guild_id))
-        return Guild(**res, _client=self._client)
+        return _get_guild_class()(**res, _client=self._client)
 
     async def delete(self, reason: Optional[str] = None) -> None:
         """
@@ -925,61 +1030,37 @@ class Message(ClientSerializerMixin, IDMixin):
         elif suppress_embeds is not MISSING:
             _flags &= ~MessageFlags.SUPPRESS_EMBEDS
 
-        from ...client.models.component import _build_components
-
         _content: str = self.content if content is MISSING else content
         _tts: bool = False if tts is MISSING else tts
 
-        if attachments is MISSING:
-            _attachments = [a._json for a in self.attachments]
-        elif not attachments:
-            _attachments = []
-        else:
-            _attachments = [a._json for a in attachments]
-
-        if not files or files is MISSING:
-            _files = []
-        elif isinstance(files, list):
-            _files = [file._json_payload(id) for id, file in enumerate(files)]
-        else:
-            _files = [files._json_payload(0)]
-            files = [files]
-
-        _files.extend(_attachments)
+        _files, files = _normalize_files(files)
 
-        if embeds is MISSING:
-            embeds = self.embeds
-        _embeds: list = (
-            ([embed._json for embed in embeds] if isinstance(embeds, list) else [embeds._json])
-            if embeds
-            else []
-        )
+        # the existing attachments ride along in the same payload list
+        if attachments is MISSING:
+            _files += map(_get_json, self.attachments)
+        elif attachments:
+            _files += map(_get_json, attachments)
 
-        _allowed_mentions: dict = (
-            {}
-            if allowed_mentions is MISSING
-            else allowed_mentions._json
-            if isinstance(allowed_mentions, AllowedMentions)
-            else allowed_mentions
-        )
+        _embeds: list = _norm_embeds(embeds, self.embeds)
+        _allowed_mentions: dict = _norm_allowed_mentions(allowed_mentions)
         _message_reference: dict = {} if message_reference is MISSING else message_reference._json
-        if not components:
-            _components = []
-        elif components is MISSING:
+        if components is MISSING:
             _components = _build_components(components=self.components)
+        elif not components:
+            _components = []
         else:
             _components = _build_components(components=components)
 
-        payload = dict(
-            content=_content,
-            tts=_tts,
-            attachments=_files,
-            embeds=_embeds,
-            allowed_mentions=_allowed_mentions,
-            message_reference=_message_reference,
-            components=_components,
-            flags=_flags,
-        )
+        payload = {
+            "content": _content,
+            "tts": _tts,
+            "attachments": _files,
+            "embeds": _embeds,
+            "allowed_mentions": _allowed_mentions,
+            "message_reference": _message_reference,
+            "components": _components,
+            "flags": _flags,
+        }
 
         _dct = await self._client.edit_message(
             channel_id=int(self.channel_id),
@@ -1037,63 +1118,40 @@ class Message(ClientSerializerMixin, IDMixin):
         """
         if not self._client:
             raise LibraryException(code=13)
-        from ...client.models.component import _build_components
-
         _content: str = "" if content is MISSING else content
         _tts: bool = False if tts is MISSING else tts
         # _file = None if file is None else file
-        # _attachments = [] if attachments else None
-        _embeds: list = (
-            []
-            if not embeds or embeds is MISSING
-            else ([embed._json for embed in embeds] if isinstance(embeds, list) else [embeds._json])
-        )
-        _allowed_mentions: dict = (
-            {}
-            if allowed_mentions is MISSING
-            else allowed_mentions._json
-            if isinstance(allowed_mentions, AllowedMentions)
-            else allowed_mentions
-        )
+        _embeds: list = _norm_embeds(embeds)
+        _allowed_mentions: dict = _norm_allowed_mentions(allowed_mentions)
         _message_reference = MessageReference(message_id=int(self.id))._json
-        _attachments = [] if attachments is MISSING else [a._json for a in attachments]
-        if not components or components is MISSING:
+        if components is MISSING or not components:
             _components = []
         else:
             _components = _build_components(components=components)
 
-        if not files or files is MISSING:
-            _files = []
-        elif isinstance(files, list):
-            _files = [file._json_payload(id) for id, file in enumerate(files)]
-        else:
-            _files = [files._json_payload(0)]
-            files = [files]
+        _files, files = _normalize_files(files)
 
-        _files.extend(_attachments)
+        if attachments is not MISSING:
+            _files += map(_get_json, attachments)
         _sticker_ids: list = (
             [] if stickers is MISSING else [str(sticker.id) for sticker in stickers]
         )
 
-        payload = dict(
-            content=_content,
-            tts=_tts,
-            attachments=_files,
-            embeds=_embeds,
-            message_reference=_message_reference,
-            allowed_mentions=_allowed_mentions,
-            components=_components,
-            sticker_ids=_sticker_ids,
-        )
+        payload = {
+            "content": _content,
+            "tts": _tts,
+            "attachments": _files,
+            "embeds": _embeds,
+            "message_reference": _message_reference,
+            "allowed_mentions": _allowed_mentions,
+            "components": _components,
+            "sticker_ids": _sticker_ids,
+        }
 
         res = await self._client.create_message(
             channel_id=int(self.channel_id), payload=payload, files=files
         )
 
-        author = {"id": None, "username": None, "discriminator": None}
-        author.update(res["author"])
-        res["author"] = author
-
         return Message(**res, _client=self._client)
 
     async def pin(self) -> None:
@@ -1130,7 +1188,8 @@ class Message(ClientSerializerMixin, IDMixin):
         res = await self._client.publish_message(
             channel_id=int(self.channel_id), message_id=int(self.id)
         )
-        return Message(**res, _client=self._client)
+        self.update(res)
+        return self
 
     async def create_thread(
         self,
@@ -1165,6 +1224,14 @@ class Message(ClientSerializerMixin, IDMixin):
         )
         return Channel(**res, _client=self._client)
 
+    @staticmethod
+    def _format_emoji(emoji: Union[str, "Emoji"]) -> str:
+        """
+        Formats an emoji into the ``name:id`` form the reaction endpoints
+        expect; plain strings pass through untouched.
+        """
+        return emoji.reaction_format if isinstance(emoji, Emoji) else emoji
+
     async def create_reaction(
         self,
         emoji: Union[str, "Emoji"],
@@ -1179,11 +1246,7 @@ class Message(ClientSerializerMixin, IDMixin):
         if not self._client:
             raise LibraryException(code=13)
 
-        _emoji = (
-            (f":{emoji.name.replace(':', '')}:{emoji.id or ''}" if emoji.id else emoji.name)
-            if isinstance(emoji, Emoji)
-            else emoji
-        )
+        _emoji = self._format_emoji(emoji)
 
         return await self._client.create_reaction(
             channel_id=int(self.channel_id), message_id=int(self.id), emoji=_emoji
@@ -1216,11 +1279,7 @@ class Message(ClientSerializerMixin, IDMixin):
         if not self._client:
             raise LibraryException(code=13)
 
-        _emoji = (
-            (f":{emoji.name.replace(':', '')}:{emoji.id or ''}" if emoji.id else emoji.name)
-            if isinstance(emoji, Emoji)
-            else emoji
-        )
+        _emoji = self._format_emoji(emoji)
 
         return await self._client.remove_all_reactions_of_emoji(
             channel_id=int(self.channel_id), message_id=int(self.id), emoji=_emoji
@@ -1240,11 +1299,7 @@ class Message(ClientSerializerMixin, IDMixin):
         if not self._client:
             raise LibraryException(code=13)
 
-        _emoji = (
-            (f":{emoji.name.replace(':', '')}:{emoji.id or ''}" if emoji.id else emoji.name)
-            if isinstance(emoji, Emoji)
-            else emoji
-        )
+        _emoji = self._format_emoji(emoji)
 
         return await self._client.remove_self_reaction(
             channel_id=int(self.channel_id), message_id=int(self.id), emoji=_emoji
@@ -1261,11 +1316,7 @@ class Message(ClientSerializerMixin, IDMixin):
         :param Union[str, Emoji] emoji: The Emoji as object or formatted as `name:id`
         :param Union[Member, user, int] user: The user or user_id to remove the reaction of
         """
-        _emoji = (
-            (f":{emoji.name.replace(':', '')}:{emoji.id or ''}" if emoji.id else emoji.name)
-            if isinstance(emoji, Emoji)
-            else emoji
-        )
+        _emoji = self._format_emoji(emoji)
         if not self._client:
             raise LibraryException(code=13)
 
@@ -1290,35 +1341,61 @@ class Message(ClientSerializerMixin, IDMixin):
         :return: A list of user objects
         :rtype: List[User]
         """
+        return [user async for user in self.iter_users_from_reaction(emoji)]
+
+    async def iter_users_from_reaction(
+        self,
+        emoji: Union[str, "Emoji"],
+    ) -> AsyncIterator[User]:
+        """
+        .. versionadded:: 4.4.0
+
+        Yields the users that reacted to the message with the given emoji
+        page by page, without loading every reactor into memory first.
+
+        :param Union[str, Emoji] emoji: The Emoji as object or formatted as `name:id`
+        :return: An async iterator over the user objects
+        :rtype: AsyncIterator[User]
+        """
         if not self._client:
             raise LibraryException(code=13)
 
-        _all_users: List[User] = []
+        _emoji = self._format_emoji(emoji)
 
-        _emoji = (
-            (f":{emoji.name.replace(':', '')}:{emoji.id or ''}" if emoji.id else emoji.name)
-            if isinstance(emoji, Emoji)
-            else emoji
-        )
+        # hoisted out of the loop: one attribute chain and id parse total
+        # instead of two per page
+        get_reactions = self._client.get_reactions_of_emoji
+        _channel_id = int(self.channel_id)
+        _message_id = int(self.id)
 
-        res: List[dict] = await self._client.get_reactions_of_emoji(
-            channel_id=int(self.channel_id), message_id=int(self.id), emoji=_emoji, limit=100
+        res: List[dict] = await get_reactions(
+            channel_id=_channel_id, message_id=_message_id, emoji=_emoji, limit=100
         )
 
         while len(res) == 100:
-            _after = int(res[-1]["id"])
-            _all_users.extend(User(**_) for _ in res)
-            res: List[dict] = await self._client.get_reactions_of_emoji(
-                channel_id=int(self.channel_id),
-                message_id=int(self.id),
-                emoji=_emoji,
-                limit=100,
-                after=_after,
+            # fire off the next page first so its round trip overlaps with
+            # building the User objects of the current one
+            _next = create_task(
+                get_reactions(
+                    channel_id=_channel_id,
+                    message_id=_message_id,
+                    emoji=_emoji,
+                    limit=100,
+                    after=int(res[-1]["id"]),
+                )
             )
-
-        _all_users.extend(User(**_) for _ in res)
-
-        return _all_users
+            try:
+                for _ in res:
+                    yield User(**_)
+            except BaseException:
+                # whether the consumer stopped early or a page failed to
+                # parse, don't leave the prefetch running
+                _next.cancel()
+                raise
+            res = await _next
+
+        for _ in res:
+            yield User(**_)
 
     @classmethod
     async def get_from_url(cls, url: str, client: "HTTPClient") -> "Message":
@@ -1333,9 +1410,10 @@ class Message(ClientSerializerMixin, IDMixin):
         :rtype: Message
         """
 
-        if "channels/" not in url:
+        match = _URL_RE.search(url)
+        if not match:
             raise LibraryException(message="You provided an invalid URL!", code=12)
-        _, _channel_id, _message_id = url.split("channels/")[1].split("/")
+        _channel_id, _message_id = match.groups()
         _message = await client.get_message(
             channel_id=_channel_id,
             message_id=_message_id,
@@ -1352,8 +1430,14 @@ class Message(ClientSerializerMixin, IDMixin):
         :return: The URL of said message
         :rtype: str
         """
-        guild = self.guild_id or "@me"
-        return f"https://discord.com/channels/{guild}/{self.channel_id}/{self.id}"
+        # messages keep an instance dict through IDMixin, so the formatted
+        # link can be memoised there; the ids never change for a message
+        url = self.__dict__.get("_url")
+        if url is None:
+            guild = self.guild_id or "@me"
+            url = f"https://discord.com/channels/{guild}/{self.channel_id}/{self.id}"
+            self.__dict__["_url"] = url
+        return url
 
     async def disable_all_components(self) -> "Message":
         """
@@ -1370,15 +1454,14 @@ class Message(ClientSerializerMixin, IDMixin):
         if not self.components:
             return self
 
-        for components in self.components:
-            for component in components.components:
-                component.disabled = True
+        for component in chain.from_iterable(row.components for row in self.components):
+            component.disabled = True
 
         return Message(
             **await self._client.edit_message(
                 int(self.channel_id),
                 int(self.id),
-                payload={"components": [component._json for component in self.components]},
+                payload={"components": list(map(_get_json, self.components))},
             ),
             _client=self._client,
         )
\ No newline at end of file
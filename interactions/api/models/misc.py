@@ -10,7 +10,6 @@ from base64 import b64encode
 from enum import Enum, IntEnum
 from io import FileIO, IOBase
 from logging import Logger
-from math import floor
 from os.path import basename
 from typing import List, Optional, Union
 
@@ -40,6 +39,9 @@ __all__ = (
 
 log: Logger = get_logger("mixin")
 
+_DISCORD_EPOCH_MS = 1420070400000
+"""Milliseconds between the Unix epoch and the first second of 2015, the Discord epoch."""
+
 
 @define()
 class Overwrite(DictSerializerMixin):
@@ -99,13 +101,14 @@ class Snowflake:
         if discord API for some odd reason will switch to integer.
     """
 
-    __slots__ = "_snowflake"
+    __slots__ = ("_snowflake", "_int")
 
     # Slotting properties are pointless, they are not in-memory
     # and are instead computed in-model.
 
     def __init__(self, snowflake: Union[int, str, "Snowflake"]) -> None:
         self._snowflake = str(snowflake)
+        self._int = None
 
     def __str__(self) -> str:
         # This is overridden for model comparison between IDs.
@@ -113,7 +116,11 @@ class Snowflake:
 
     def __int__(self) -> int:
         # Easier to use for HTTP calling instead of int(str(obj)).
-        return int(self._snowflake)
+        # Parsed lazily and kept around: HTTP wrappers call int() on the
+        # same ids over and over.
+        if (value := self._int) is None:
+            self._int = value = int(self._snowflake)
+        return value
 
     @property
     def increment(self) -> int:
@@ -123,7 +130,7 @@ class Snowflake:
 
         :return: An integer denoting the increment.
         """
-        return int(self._snowflake) & 0xFFF
+        return int(self) & 0xFFF
 
     @property
     def worker_id(self) -> int:
@@ -132,7 +139,7 @@ class Snowflake:
 
         :return: An integer denoting the internal worker ID.
         """
-        return (int(self._snowflake) & 0x3E0000) >> 17
+        return (int(self) & 0x3E0000) >> 17
 
     @property
     def process_id(self) -> int:
@@ -141,7 +148,7 @@ class Snowflake:
 
         :return: An integer denoting the internal process ID.
         """
-        return (int(self._snowflake) & 0x1F000) >> 12
+        return (int(self) & 0x1F000) >> 12
 
     @property
     def epoch(self) -> float:
@@ -150,7 +157,7 @@ class Snowflake:
 
         :return: A float containing the seconds since Discord Epoch.
         """
-        return floor(((int(self._snowflake) >> 22) + 1420070400000) / 1000)
+        return ((int(self) >> 22) + _DISCORD_EPOCH_MS) // 1000
 
     @property
     def timestamp(self) -> datetime.datetime:
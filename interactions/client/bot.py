@@ -628,7 +628,7 @@ class Client:
 
             if cmd.scope not in (MISSING, None):
                 if isinstance(cmd.scope, List):
-                    [self._scopes.add(_ if isinstance(_, int) else _.id) for _ in cmd.scope]
+                    self._scopes.update(_ if isinstance(_, int) else _.id for _ in cmd.scope)
                 else:
                     self._scopes.add(cmd.scope if isinstance(cmd.scope, int) else cmd.scope.id)
 
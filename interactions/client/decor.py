@@ -84,9 +84,9 @@ def command(
     if scope is not MISSING:
         if isinstance(scope, list):
             if all(isinstance(guild, Guild) for guild in scope):
-                [_scope.append(guild.id) for guild in scope]
+                _scope.extend(guild.id for guild in scope)
             elif all(isinstance(guild, int) for guild in scope):
-                [_scope.append(guild) for guild in scope]
+                _scope.extend(scope)
         else:
             _scope.append(scope)
 
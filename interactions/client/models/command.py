@@ -2,6 +2,7 @@ import contextlib
 from asyncio import CancelledError
 from functools import wraps
 from inspect import getdoc, signature
+from sys import intern
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -32,6 +33,8 @@ if TYPE_CHECKING:
     from ..bot import Client, Extension
     from ..context import CommandContext
 
+_SUBCOMMAND_TYPES = frozenset({OptionType.SUB_COMMAND, OptionType.SUB_COMMAND_GROUP})
+
 __all__ = (
     "Choice",
     "Option",
@@ -144,6 +147,10 @@ class Option(DictSerializerMixin):
     converter: Optional[str] = field(default=None)
 
     def __attrs_post_init__(self):
+        if self.name is not None:
+            # option names recur across commands and are compared all over dispatch;
+            # interning makes those checks pointer-compares and dedupes the strings
+            self.name = intern(self.name)
         # needed for nested classes
         if self.options is not None:
             self.options = [
@@ -425,6 +432,7 @@ class Command(DictSerializerMixin):
     def __attrs_post_init__(self) -> None:
         if self.name is MISSING:
             self.name = self.coro.__name__
+        self.name = intern(self.name)
         if self.description is MISSING and self.type == ApplicationCommandType.CHAT_INPUT:
             self.description = getdoc(self.coro) or "No description set"
             self.description = self.description.split("\n", 1)[0]
@@ -489,7 +497,7 @@ class Command(DictSerializerMixin):
         :return: Whether the command has subcommand options.
         :rtype: bool
         """
-        return len(self.coroutines) > 0
+        return bool(self.coroutines)
 
     def subcommand(
         self,
@@ -875,8 +883,7 @@ class Command(DictSerializerMixin):
                 code=11, message="Only chat input commands can have subcommands."
             )
         if self.options and any(
-            option.type not in (OptionType.SUB_COMMAND, OptionType.SUB_COMMAND_GROUP)
-            for option in self.options
+            option.type not in _SUBCOMMAND_TYPES for option in self.options
         ):
             raise LibraryException(
                 code=11, message="Subcommands are incompatible with base command options."
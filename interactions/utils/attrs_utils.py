@@ -1,7 +1,6 @@
-from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, Mapping, Optional, Tuple
 
 import attrs
@@ -14,6 +13,51 @@ __all__ = (
 )
 
 
+def _copy_kwargs(obj):
+    """
+    Recursively copies the dict/list structure of a payload. Unlike
+    copy.deepcopy there is no memo bookkeeping or reduce dispatch;
+    JSON scalar leaves are immutable and therefore shared, not copied.
+    """
+    _type = type(obj)
+    if _type is dict:
+        return {key: _copy_kwargs(value) for key, value in obj.items()}
+    if _type is list:
+        return [_copy_kwargs(item) for item in obj]
+    return obj
+
+
+def _init_fields(cls: type) -> Tuple[tuple, ...]:
+    """
+    Collects the init-relevant data of every attrs field of a class once
+    and caches it on the class, so instance creation does not have to
+    re-read attribute metadata for every field of every object.
+    """
+    fields = cls.__dict__.get("__init_fields__")
+    if fields is None:
+        fields = []
+        attribs: Tuple[attrs.Attribute, ...] = cls.__attrs_attrs__  # type: ignore
+        for attrib in attribs:
+            if attrib.init:
+                # attrs is weird
+                attrib_name = attrib.name
+                if attrib_name[0] == "_":
+                    attrib_name = attrib_name[1:]
+
+                discord_name = attrib.metadata.get("discord_name") or attrib_name
+                fields.append(
+                    (
+                        attrib_name,
+                        discord_name,
+                        bool(attrib.metadata.get("add_client")),
+                        attrib.default,
+                    )
+                )
+        fields = tuple(fields)
+        cls.__init_fields__ = fields
+    return fields
+
+
 @attrs.define(eq=False, init=False, on_setattr=attrs.setters.NO_OP)
 class DictSerializerMixin:
     _extras: dict = attrs.field(init=False, repr=False)
@@ -28,53 +72,36 @@ class DictSerializerMixin:
         client = kwargs.pop("_client", None)
 
         if self.__deepcopy_kwargs__:
-            kwargs = deepcopy(kwargs)
+            kwargs = _copy_kwargs(kwargs)
 
         passed_kwargs = {}
 
-        attribs: Tuple[attrs.Attribute, ...] = self.__attrs_attrs__  # type: ignore
-        for attrib in attribs:
-            if attrib.init:
-                # attrs is weird
-                attrib_name = attrib.name
-                if attrib_name[0] == "_":
-                    attrib_name = attrib_name[1:]
-
-                if discord_name := attrib.metadata.get("discord_name"):
-                    discord_name = discord_name
-                else:
-                    discord_name = attrib_name
-
-                if (value := kwargs.pop(discord_name, MISSING)) is not MISSING:
-                    if (
-                        value is not None
-                        and attrib.metadata.get("add_client")
-                        and client is not None
-                    ):
-                        if isinstance(value, list):
-                            for item in value:
-                                if isinstance(item, dict):
-                                    item["_client"] = client
-                                elif isinstance(item, DictSerializerMixin):
-                                    item._client = client
-                        elif isinstance(value, dict):
-                            value["_client"] = client
-                        elif isinstance(value, DictSerializerMixin):
-                            value._client = client
-
-                    passed_kwargs[attrib_name] = value
-
-                elif attrib.default is not attrs.NOTHING:
-                    # handle defaults like attrs does
-                    default = attrib.default
-                    if isinstance(default, attrs.Factory):  # type: ignore
-                        passed_kwargs[attrib_name] = (
-                            default.factory(self) if default.takes_self else default.factory()
-                        )
-                    else:
-                        passed_kwargs[attrib_name] = default
+        for attrib_name, discord_name, add_client, default in _init_fields(type(self)):
+            if (value := kwargs.pop(discord_name, MISSING)) is not MISSING:
+                if value is not None and add_client and client is not None:
+                    if isinstance(value, list):
+                        for item in value:
+                            if isinstance(item, dict):
+                                item["_client"] = client
+                            elif isinstance(item, DictSerializerMixin):
+                                item._client = client
+                    elif isinstance(value, dict):
+                        value["_client"] = client
+                    elif isinstance(value, DictSerializerMixin):
+                        value._client = client
+
+                passed_kwargs[attrib_name] = value
+
+            elif default is not attrs.NOTHING:
+                # handle defaults like attrs does
+                if isinstance(default, attrs.Factory):  # type: ignore
+                    passed_kwargs[attrib_name] = (
+                        default.factory(self) if default.takes_self else default.factory()
+                    )
                 else:
-                    passed_kwargs[attrib_name] = None
+                    passed_kwargs[attrib_name] = default
+            else:
+                passed_kwargs[attrib_name] = None
 
         self._extras = kwargs
         self.__attrs_init__(**passed_kwargs)  # type: ignore
@@ -141,6 +168,7 @@ class ClientSerializerMixin(DictSerializerMixin):
         super().__init__(**kwargs)
 
 
+@lru_cache(maxsize=None)
 def convert_list(converter):
     """A helper function to convert items in a list with the specified converter"""
 
@@ -152,6 +180,10 @@ def convert_list(converter):
         if len(list) == 0:
             return list
 
+        # already a list of converted objects, e.g. model attributes fed back through update()
+        if type(list[0]) is converter:
+            return list
+
         # all items should be of the same type
         if isinstance(list[0], Mapping):
             return [converter(**item) for item in list]
@@ -223,7 +255,11 @@ def deepcopy_kwargs(cls: Optional[type] = None):
     return decorator
 
 
-define_defaults = dict(kw_only=True, eq=False, init=False, on_setattr=attrs.setters.NO_OP)
+# slots is already the attrs.define default, but the embed/field models rely on
+# the dict-less layout for their memory footprint, so pin it explicitly
+define_defaults = dict(
+    kw_only=True, eq=False, init=False, slots=True, on_setattr=attrs.setters.NO_OP
+)
 
 
 @wraps(attrs.define)